@@ -13,9 +13,8 @@ The analysis includes:
 
 # Import required modules for data creation and sequence analysis
 from src.keypad_data import get_keypad_data
-from src.positions import get_vowel_positions, get_missing_positions, get_coordinate_bounds
-from src.sequence_check import check_inside_bounds, check_in_avoided_coordinate
-from src.sequence_create import get_all_sequences
+from src.positions import classify_coordinates, get_coordinate_bounds
+from src.sequence_create import count_all_sequences
 
 if __name__ == "__main__":
     
@@ -33,15 +32,18 @@ if __name__ == "__main__":
     print(f"  ... and {len(coordinate_data) - 10} more coordinates")
     print()
 
+    # Classify the coordinate data in a single pass
+    positions = classify_coordinates(coordinate_data)
+
     # Find all missing/empty positions in the coordinate data
     # These positions will be avoided during sequence generation
-    miss_pos = get_missing_positions(coordinate_data)
-    print(f"Missing positions (to avoid): {miss_pos}")
+    miss_pos = positions['missing']
+    print(f"Missing positions (to avoid): {sorted(miss_pos)}")
 
     # Find all vowel positions (A, E, I, O, U) in the coordinate data  
     # These are special positions that we want to limit visits to
-    vo_pos = get_vowel_positions(coordinate_data)
-    print(f"Vowel positions (limited visits): {vo_pos}")
+    vo_pos = positions['vowels']
+    print(f"Vowel positions (limited visits): {sorted(vo_pos)}")
 
     # Extract the numeric bounds of the coordinate data
     # This gives us [x_min, x_max, y_min, y_max] for boundary checking
@@ -54,11 +56,12 @@ if __name__ == "__main__":
     # STEP 2: Define sequence validation criteria
     # =================================================================
     
-    # Create a filter function that validates knight move sequences
     # A valid sequence must:
-    # 1. Stay within the coordinate boundaries (check_inside_bounds)
-    # 2. Avoid all missing/empty positions (not check_in_avoided_coordinate)
-    filter = lambda sequence: (check_inside_bounds(sequence, *idx_bounds)) and (not check_in_avoided_coordinate(sequence, miss_pos))
+    # 1. Stay within the coordinate boundaries (bounds)
+    # 2. Avoid all missing/empty positions (avoid_list)
+    # Both are resolved into a precomputed knight-neighbor table on the board,
+    # so invalid moves are never generated instead of being filtered afterwards
+    board_bounds = tuple(idx_bounds)
 
     # =================================================================
     # STEP 3: Generate and count valid knight move sequences
@@ -85,24 +88,26 @@ if __name__ == "__main__":
         # Loop through all y coordinates (columns)
         for y_i in range(y_min, y_max + 1):
             
-            # Generate all valid knight move sequences from position (x_i, y_i)
+            # Count all valid knight move sequences from position (x_i, y_i)
+            # Only the totals are reported, so the sequences are never materialized
             # Constraints applied:
             # - location_list=vo_pos: Track visits to vowel positions
             # - max_hit=2: Maximum 2 visits to vowel positions allowed
-            # - filter=filter: Apply boundary and avoidance constraints
-            all_sequence_list = get_all_sequences(
+            # - bounds/avoid_list: Apply boundary and avoidance constraints
+            n_sequences = count_all_sequences(
                 x_i, y_i, step_i, 
                 location_list=vo_pos, 
                 max_hit=max_hit, 
-                filter=filter
+                bounds=board_bounds,
+                avoid_list=miss_pos
             )
 
             # Add the number of valid sequences from this starting position
-            total_sequences += len(all_sequence_list)
+            total_sequences += n_sequences
 
             # Optional: Print progress for each starting position
-            if len(all_sequence_list) > 0:
-                print(f"  Starting position ({x_i},{y_i}): {len(all_sequence_list)} valid sequences")
+            if n_sequences > 0:
+                print(f"  Starting position ({x_i},{y_i}): {n_sequences} valid sequences")
 
     # =================================================================
     # STEP 4: Display final results
@@ -5,18 +5,19 @@ Prints total number of sequences in a single line.
 """
 
 from src.keypad_data import get_keypad_data
-from src.positions import get_vowel_positions, get_missing_positions, get_coordinate_bounds
-from src.sequence_check import check_inside_bounds, check_in_avoided_coordinate
-from src.sequence_create import get_all_sequences
+from src.positions import classify_coordinates, get_coordinate_bounds
+from src.sequence_create import count_all_sequences
 
 def main():
     # Get coordinate data and analysis parameters
     coordinate_data = get_keypad_data()    
-    miss_pos = get_missing_positions(coordinate_data)
-    vo_pos = get_vowel_positions(coordinate_data)
+    # Missing and vowel positions from a single pass over the keypad
+    positions = classify_coordinates(coordinate_data)
+    miss_pos = positions['missing']
+    vo_pos = positions['vowels']
     bounds_dict = get_coordinate_bounds(coordinate_data)
     idx_bounds = [bounds_dict['x_min'], bounds_dict['x_max'], bounds_dict['y_min'], bounds_dict['y_max']]
-    filter = lambda sequence: (check_inside_bounds(sequence, *idx_bounds)) and (not check_in_avoided_coordinate(sequence, miss_pos))
+    board_bounds = tuple(idx_bounds)
     
     # Extract bounds
     x_min, x_max = bounds_dict['x_min'], bounds_dict['x_max']
@@ -34,15 +35,17 @@ def main():
     # Generate sequences from all starting positions
     for x_i in range(x_min, x_max + 1):
         for y_i in range(y_min, y_max + 1):
-            all_sequence_list = get_all_sequences(
+            # Only the count is needed, so the sequences are never materialized
+            n_sequences = count_all_sequences(
                 x_i, y_i, step_i,
                 location_list=vo_pos,
                 max_hit=max_hit,
-                filter=filter
-            )            
+                bounds=board_bounds,
+                avoid_list=miss_pos
+            )
             
             # Add the number of valid sequences from this starting position
-            total_sequences += len(all_sequence_list)
+            total_sequences += n_sequences
     
     print(f"Total number of valid sequences: {total_sequences}")
 
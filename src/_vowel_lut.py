@@ -0,0 +1,31 @@
+"""
+Shared vowel lookup tables for the vowel-testing code in positions.py and the vowel_check modules.
+"""
+
+# The English vowels, lowercase and in both cases
+LOWER_VOWELS = "aeiou"
+VOWELS = LOWER_VOWELS + LOWER_VOWELS.upper()
+
+# Single-character vowels, for O(1) membership tests
+VOWEL_SET = frozenset(VOWELS)
+
+# str.translate table that deletes every vowel
+DELETE_VOWELS = str.maketrans("", "", VOWELS)
+
+# The vowels as ASCII bytes, for bytes.translate(None, VOWEL_BYTES)
+VOWEL_BYTES = VOWELS.encode("ascii")
+
+# One bit per distinct vowel (a=1, e=2, i=4, o=8, u=16), the same for both cases
+VOWEL_BITS = {vowel: 1 << i for i, vowel in enumerate(LOWER_VOWELS)}
+VOWEL_BITS.update({vowel.upper(): bit for vowel, bit in VOWEL_BITS.items()})
+
+# Number of distinct vowels in each of the 32 possible vowel masks
+VOWEL_MASK_SIZES = tuple(bin(mask).count("1") for mask in range(1 << len(LOWER_VOWELS)))
+
+# The lowercase vowels in each of the 32 possible vowel masks
+MASK_VOWELS = tuple(frozenset(vowel for i, vowel in enumerate(LOWER_VOWELS) if mask >> i & 1)
+                    for mask in range(1 << len(LOWER_VOWELS)))
+
+# The same vowels as tuples in alphabetical order, for display without sorting
+MASK_SORTED_VOWELS = tuple(tuple(vowel for i, vowel in enumerate(LOWER_VOWELS) if mask >> i & 1)
+                           for mask in range(1 << len(LOWER_VOWELS)))
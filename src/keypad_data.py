@@ -1,5 +1,20 @@
 from typing import List, Tuple
 
+# Keypad layout, one list of cell values per row
+_GRID_ROWS = [
+    ["A", "B", "C", "D", "E"],    # Row 1: Letters A-E
+    ["F", "G", "H", "I", "J"],    # Row 2: Letters F-J  
+    ["K", "L", "M", "N", "O"],    # Row 3: Letters K-O
+    ["", "1", "2", "3", ""]       # Row 4: Numbers 1-3 with empty corners
+]
+
+# The keypad never changes, so its (row, column, value) tuples are built once at import
+_KEYPAD_DATA: Tuple[Tuple[int, int, str], ...] = tuple(
+    (row_idx, col_idx, cell_value)
+    for row_idx, row_data in enumerate(_GRID_ROWS, start=1)
+    for col_idx, cell_value in enumerate(row_data, start=1)
+)
+
 def get_keypad_data() -> List[Tuple[int, int, str]]:
     """
     Create and return a list of tuples representing keypad data with coordinates.
@@ -7,21 +22,11 @@ def get_keypad_data() -> List[Tuple[int, int, str]]:
     This function generates coordinate-based data for a 4x5 keypad containing 
     letters and numbers. Each tuple contains (row, column, value) representing
     the position and content at that coordinate.
-    """
 
-    grid_rows = [
-        ["A", "B", "C", "D", "E"],    # Row 1: Letters A-E
-        ["F", "G", "H", "I", "J"],    # Row 2: Letters F-J  
-        ["K", "L", "M", "N", "O"],    # Row 3: Letters K-O
-        ["", "1", "2", "3", ""]       # Row 4: Numbers 1-3 with empty corners
-    ]
-
-    coordinate_data = []
-    for row_idx, row_data in enumerate(grid_rows, start=1):
-        for col_idx, cell_value in enumerate(row_data, start=1):
-            coordinate_data.append((row_idx, col_idx, cell_value))
-
-    return coordinate_data
+    The tuples are built once at import; each call returns a new list of them,
+    so callers may modify the list without affecting later calls.
+    """
+    return list(_KEYPAD_DATA)
 
 
 if __name__ == "__main__":
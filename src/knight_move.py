@@ -1,5 +1,16 @@
 from typing import List, Tuple
 
+# All 8 possible knight moves (dx, dy), indexed by move_direction - 1
+_KNIGHT_MOVES: Tuple[Tuple[int, int], ...] = (
+    (2, 1),   # Move 1: 2 right, 1 up
+    (2, -1),  # Move 2: 2 right, 1 down
+    (-2, 1),  # Move 3: 2 left, 1 up
+    (-2, -1), # Move 4: 2 left, 1 down
+    (1, 2),   # Move 5: 1 right, 2 up
+    (1, -2),  # Move 6: 1 right, 2 down
+    (-1, 2),  # Move 7: 1 left, 2 up
+    (-1, -2)  # Move 8: 1 left, 2 down
+)
 
 def knight_move(x_i: int, y_i: int, move_direction: int) -> Tuple[int, int]:
     """
@@ -47,23 +58,11 @@ def knight_move(x_i: int, y_i: int, move_direction: int) -> Tuple[int, int]:
     - Move directions are numbered consistently for easy reference
     """
     
-    # Define all 8 possible knight moves (dx, dy)
-    knight_moves = [
-        (2, 1),   # Move 1: 2 right, 1 up
-        (2, -1),  # Move 2: 2 right, 1 down
-        (-2, 1),  # Move 3: 2 left, 1 up
-        (-2, -1), # Move 4: 2 left, 1 down
-        (1, 2),   # Move 5: 1 right, 2 up
-        (1, -2),  # Move 6: 1 right, 2 down
-        (-1, 2),  # Move 7: 1 left, 2 up
-        (-1, -2)  # Move 8: 1 left, 2 down
-    ]
-    
     if move_direction < 1 or move_direction > 8:
         raise ValueError("move_direction must be between 1 and 8")
     
     # Get the move offset
-    dx, dy = knight_moves[move_direction - 1]
+    dx, dy = _KNIGHT_MOVES[move_direction - 1]
     
     # Calculate final position
     x_f = x_i + dx
@@ -114,13 +113,8 @@ def all_knight_moves(x_i: int, y_i: int) -> List[Tuple[int, int]]:
     ---------
     knight_move : Calculate a single knight move in a specific direction
     """
-    knight_moves = [
-        (2, 1), (2, -1), (-2, 1), (-2, -1),
-        (1, 2), (1, -2), (-1, 2), (-1, -2)
-    ]
-    
     possible_moves = []
-    for dx, dy in knight_moves:
+    for dx, dy in _KNIGHT_MOVES:
         x_f = x_i + dx
         y_f = y_i + dy
         possible_moves.append((x_f, y_f))
@@ -1,12 +1,20 @@
-from typing import List, Tuple, Dict, Union, Any
+from typing import FrozenSet, List, Tuple, Dict, Union, Any
+try:
+    from src._vowel_lut import VOWEL_SET
+except ModuleNotFoundError:
+    # Run directly as a script (python src/<module>.py), so src/ itself is on the path
+    from _vowel_lut import VOWEL_SET
 
-def get_vowel_positions(coordinate_data: List[Tuple[int, int, str]]) -> List[Tuple[int, int]]:
+# Lowercase string forms that count as a missing value
+_MISSING_STRINGS = frozenset(['none', 'nan', 'null', 'na'])
+
+def get_vowel_positions(coordinate_data: List[Tuple[int, int, str]]) -> FrozenSet[Tuple[int, int]]:
     """
     Find the row and column indices where grid elements are vowels.
     
     This function scans through coordinate data and identifies positions where
     the elements are vowels (a, e, i, o, u), regardless of case. It returns
-    a list of tuples containing the row and column indices of vowel elements.
+    a frozenset of tuples containing the row and column indices of vowel elements.
     
     Parameters:
     -----------
@@ -16,24 +24,24 @@ def get_vowel_positions(coordinate_data: List[Tuple[int, int, str]]) -> List[Tup
     
     Returns:
     --------
-    List[Tuple[int, int]]
-        A list of (row, column) tuples where vowels are found.
+    FrozenSet[Tuple[int, int]]
+        A frozenset of (row, column) tuples where vowels are found.
         Each tuple represents the position of a vowel in the grid.
-        Returns empty list if no vowels are found.
+        Returns an empty frozenset if no vowels are found.
     
     Examples:
     ---------
     >>> data = [(1, 1, 'A'), (1, 2, 'B'), (2, 1, 'C'), (2, 2, 'E')]
     >>> get_vowel_positions(data)
-    [(1, 1), (2, 2)]  # 'A' at (1,1) and 'E' at (2,2)
+    frozenset({(1, 1), (2, 2)})  # 'A' at (1,1) and 'E' at (2,2)
     
     >>> data2 = [(1, 1, 'X'), (1, 2, 'Y'), (2, 1, 'Z'), (2, 2, 'W')]
     >>> get_vowel_positions(data2)
-    []  # No vowels found
+    frozenset()  # No vowels found
     
     >>> data3 = [(1, 1, 'a'), (1, 2, '1'), (2, 1, 'O'), (2, 2, 'u')]
     >>> get_vowel_positions(data3)
-    [(1, 1), (2, 1), (2, 2)]  # 'a', 'O', and 'u' are vowels
+    frozenset({(1, 1), (2, 1), (2, 2)})  # 'a', 'O', and 'u' are vowels
     
     Notes:
     ------
@@ -41,7 +49,9 @@ def get_vowel_positions(coordinate_data: List[Tuple[int, int, str]]) -> List[Tup
     - Only considers English vowels: a, e, i, o, u
     - Non-string elements are converted to string for vowel checking
     - Only single-character elements (after string conversion) are considered
-    - Returns empty list if input data is empty or contains no vowels
+    - Returns an empty frozenset if input data is empty or contains no vowels
+    - The result is immutable and gives O(1) membership tests; use sorted()
+      for a deterministic listing
     
     Performance:
     -----------
@@ -60,24 +70,12 @@ def get_vowel_positions(coordinate_data: List[Tuple[int, int, str]]) -> List[Tup
     get_missing_positions : Find positions with missing/empty values
     get_coordinate_bounds : Get coordinate boundaries from data
     """
-    # Define vowels for checking (both cases for efficiency)
-    vowels = "aeiouAEIOU"
-    
-    # List to store positions of vowels
-    vowel_positions = []
-    
-    # Iterate through all coordinate tuples
-    for row, col, value in coordinate_data:
-        # Convert to string in case element is not a string
-        value_str = str(value)
-        
-        # Check if the element is a single vowel
-        if len(value_str) == 1 and value_str in vowels:
-            vowel_positions.append((row, col))
-    
-    return vowel_positions
+    # Single-character vowels only, so one set lookup also covers the length check.
+    # Strings (the common case) are looked up as-is, anything else is converted first
+    return frozenset((row, col) for row, col, value in coordinate_data
+                     if (value if type(value) is str else str(value)) in VOWEL_SET)
 
-def get_missing_positions(coordinate_data: List[Tuple[int, int, str]]) -> List[Tuple[int, int]]:
+def get_missing_positions(coordinate_data: List[Tuple[int, int, str]]) -> FrozenSet[Tuple[int, int]]:
     """
     Find positions in coordinate data where values are missing or effectively empty.
     
@@ -94,10 +92,10 @@ def get_missing_positions(coordinate_data: List[Tuple[int, int, str]]) -> List[T
     
     Returns:
     --------
-    List[Tuple[int, int]]
-        A list of (row, column) tuples where missing values are found.
+    FrozenSet[Tuple[int, int]]
+        A frozenset of (row, column) tuples where missing values are found.
         Each tuple represents a position containing a missing or empty value.
-        Returns empty list if no missing values are found.
+        Returns an empty frozenset if no missing values are found.
     
     Missing Value Types Detected:
     -----------------------------
@@ -110,15 +108,15 @@ def get_missing_positions(coordinate_data: List[Tuple[int, int, str]]) -> List[T
     ---------
     >>> data = [(1, 1, 'A'), (1, 2, ''), (2, 1, None), (2, 2, 'C')]
     >>> get_missing_positions(data)
-    [(1, 2), (2, 1)]  # Empty string and None
+    frozenset({(1, 2), (2, 1)})  # Empty string and None
     
     >>> data2 = [(1, 1, 'A'), (1, 2, 'B'), (2, 1, 'C'), (2, 2, 'D')]
     >>> get_missing_positions(data2)
-    []  # No missing values
+    frozenset()  # No missing values
     
     >>> data3 = [(1, 1, '  '), (1, 2, '\t'), (2, 1, '\n'), (2, 2, '   ')]
     >>> get_missing_positions(data3)
-    [(1, 1), (1, 2), (2, 1), (2, 2)]  # All whitespace strings
+    frozenset({(1, 1), (1, 2), (2, 1), (2, 2)})  # All whitespace strings
     
     Notes:
     ------
@@ -126,6 +124,8 @@ def get_missing_positions(coordinate_data: List[Tuple[int, int, str]]) -> List[T
     - Considers only completely whitespace strings as missing (not partial whitespace)
     - Does not modify the input coordinate data
     - Handles None values and string representations of missing data
+    - The result is immutable and gives O(1) membership tests; use sorted()
+      for a deterministic listing
     
     Performance:
     -----------
@@ -146,28 +146,66 @@ def get_missing_positions(coordinate_data: List[Tuple[int, int, str]]) -> List[T
     get_coordinate_bounds : Get coordinate boundaries from data
     """
     
-    # List to store positions of missing values
+    return frozenset((row, col) for row, col, value in coordinate_data if _is_missing_value(value))
+
+def _is_missing_value(value: Any) -> bool:
+    # Check for None values
+    if value is None:
+        return True
+    # Check for string representations and empty/whitespace strings
+    if isinstance(value, str):
+        return value.strip() == "" or value.lower() in _MISSING_STRINGS
+    # Convert non-string values to string and check for missing representations
+    return str(value).lower() in _MISSING_STRINGS
+
+def classify_coordinates(coordinate_data: List[Tuple[int, int, str]]) -> Dict[str, FrozenSet[Tuple[int, int]]]:
+    """
+    Find vowel and missing positions in a single pass over coordinate data.
+    
+    This function combines get_vowel_positions and get_missing_positions: each
+    coordinate tuple is unpacked once and checked for both conditions, instead
+    of scanning the data twice when both results are needed.
+    
+    Parameters:
+    -----------
+    coordinate_data : List[Tuple[int, int, str]]
+        List of coordinate tuples in format (row, column, value).
+        Each tuple represents a position and its content in the grid.
+    
+    Returns:
+    --------
+    Dict[str, FrozenSet[Tuple[int, int]]]
+        A dictionary with the following keys:
+        - 'vowels': frozenset of (row, column) tuples, as from get_vowel_positions
+        - 'missing': frozenset of (row, column) tuples, as from get_missing_positions
+    
+    Examples:
+    ---------
+    >>> data = [(1, 1, 'A'), (1, 2, ''), (2, 1, None), (2, 2, 'E')]
+    >>> classify_coordinates(data)
+    {'vowels': frozenset({(1, 1), (2, 2)}), 'missing': frozenset({(1, 2), (2, 1)})}
+    
+    Notes:
+    ------
+    - Vowel and missing values are detected exactly as in get_vowel_positions
+      and get_missing_positions; a position is never in both sets
+    
+    See Also:
+    ---------
+    get_vowel_positions : Find positions containing vowel characters
+    get_missing_positions : Find positions with missing/empty values
+    """
+    vowel_positions = []
     missing_positions = []
     
-    # Iterate through all coordinate tuples
     for row, col, value in coordinate_data:
-        # Check for None values
-        if value is None:
+        value_str = value if type(value) is str else str(value)
+        if value_str in VOWEL_SET:
+            vowel_positions.append((row, col))
+        elif _is_missing_value(value):
             missing_positions.append((row, col))
-        # Check for string representations and empty/whitespace strings
-        elif isinstance(value, str):
-            if value == "" or value.strip() == "":
-                missing_positions.append((row, col))
-            # Check for string representations of missing values
-            elif value.lower() in ['none', 'nan', 'null', 'na']:
-                missing_positions.append((row, col))
-        # Convert non-string values to string and check for missing representations
-        else:
-            value_str = str(value).lower()
-            if value_str in ['none', 'nan', 'null', 'na']:
-                missing_positions.append((row, col))
     
-    return missing_positions
+    return {'vowels': frozenset(vowel_positions), 'missing': frozenset(missing_positions)}
 
 def get_coordinate_bounds(coordinate_data: List[Tuple[int, int, str]]) -> Dict[str, Any]:
     """
@@ -288,7 +326,7 @@ if __name__ == "__main__":
     print(f"  ... and {len(test_data) - 5} more items")
     print()
 
-    test_vowel_positions = get_vowel_positions(test_data)
+    test_vowel_positions = sorted(get_vowel_positions(test_data))
     print(f"Vowel positions in test data: {test_vowel_positions}")
     print()
 
@@ -315,7 +353,7 @@ if __name__ == "__main__":
         print(f"  {item}")
     print()
 
-    mixed_vowel_positions = get_vowel_positions(mixed_data)
+    mixed_vowel_positions = sorted(get_vowel_positions(mixed_data))
     print(f"Vowel positions in mixed data: {mixed_vowel_positions}")
     print()
 
@@ -344,7 +382,7 @@ if __name__ == "__main__":
         print(f"  {item}")
     print()
 
-    missing_positions = get_missing_positions(test_missing_data)
+    missing_positions = sorted(get_missing_positions(test_missing_data))
     print(f"Missing value positions: {missing_positions}")
     print()
 
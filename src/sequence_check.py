@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import AbstractSet, List, Tuple, Union
 
 
 def check_inside_bounds(sequence: List[Tuple[int, int]], x_min: int, x_max: int, y_min: int, y_max: int) -> bool:
@@ -8,18 +8,28 @@ def check_inside_bounds(sequence: List[Tuple[int, int]], x_min: int, x_max: int,
     return True
 
 
-def check_in_avoided_coordinate(sequence: List[Tuple[int, int]], list_of_coordinates: List[Tuple[int, int]]) -> bool:
-    return any((x, y) in list_of_coordinates for (x, y) in sequence)
+def check_in_avoided_coordinate(sequence: List[Tuple[int, int]], list_of_coordinates: Union[List[Tuple[int, int]], AbstractSet[Tuple[int, int]]]) -> bool:
+    # Hash the coordinates once so each probe is O(1); callers may pass a prebuilt frozenset
+    avoid = list_of_coordinates if isinstance(list_of_coordinates, (set, frozenset)) else frozenset(list_of_coordinates)
+    return not avoid.isdisjoint(sequence)
 
 
 def check_same_alternate_coordinate_exists(sequence: List[Tuple[int, int]]) -> bool:
     if len(sequence) < 3:
         return False
-    return any(sequence[i] == sequence[i-2] for i in range(2, len(sequence)))
-
-
-def count_sequence_hit_location_list(sequence: List[Tuple[int, int]], location_list: List[Tuple[int, int]]) -> int:
-    return sum([1 for coordinate in sequence if coordinate in location_list])
+    # Rolling window over the last two coordinates instead of indexing twice per step
+    prev2, prev1 = sequence[0], sequence[1]
+    for coordinate in sequence[2:]:
+        if coordinate == prev2:
+            return True
+        prev2, prev1 = prev1, coordinate
+    return False
+
+
+def count_sequence_hit_location_list(sequence: List[Tuple[int, int]], location_list: Union[List[Tuple[int, int]], AbstractSet[Tuple[int, int]]]) -> int:
+    # Booleans summed through map() keep the whole loop in C
+    location_set = location_list if isinstance(location_list, (set, frozenset)) else frozenset(location_list)
+    return sum(map(location_set.__contains__, sequence))
 
 
 if __name__ == "__main__":
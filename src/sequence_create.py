@@ -1,6 +1,15 @@
-from typing import Union, Callable, Optional, Any, List, Tuple
-from src.knight_move import all_knight_moves
-from src.sequence_check import count_sequence_hit_location_list
+from functools import lru_cache
+from typing import AbstractSet, Union, Callable, Optional, Any, Dict, Iterator, List, Tuple
+from src.knight_move import _KNIGHT_MOVES
+
+CoordinateCollection = Union[List[Tuple[int, int]], AbstractSet[Tuple[int, int]]]
+# Per board cell: (neighbor cell, neighbor is a hit location) for every legal knight move
+MoveTable = Tuple[Tuple[Tuple[int, bool], ...], ...]
+# A prepared search: (start, start_hits, cells, moves, reversed_moves, hit_limit)
+Board = Tuple[int, int, Tuple[Tuple[int, int], ...], MoveTable, MoveTable, int]
+# The knight moves in reverse, so a DFS pushing children in this order pops them in
+# _KNIGHT_MOVES order
+_REVERSED_KNIGHT_MOVES = _KNIGHT_MOVES[::-1]
 
 def is_coordinate_tuple(element: Any) -> bool:
     """
@@ -28,45 +37,464 @@ def check_and_convert(element: Union[Tuple[int, int], List[Tuple[int, int]], Lis
     else:
         raise ValueError("Input must be a coordinate tuple, list of coordinate tuples, or list of lists of coordinate tuples.")
 
-def add_step(l_in: Union[Tuple[int, int], List[Tuple[int, int]], List[List[Tuple[int, int]]]]) -> List[List[Tuple[int, int]]]:
-    l_in = check_and_convert(l_in)
-    l_out = []
+def add_step(
+    l_in: Union[Tuple[int, int], List[Tuple[int, int]], List[List[Tuple[int, int]]]],
+    accept: Optional[Callable[[List[Tuple[int, int]]], bool]] = None
+) -> List[List[Tuple[int, int]]]:
+    return _add_step_fast(check_and_convert(l_in), accept)
+
+def _add_step_fast(
+    l_in: List[List[Tuple[int, int]]],
+    accept: Optional[Callable[[List[Tuple[int, int]]], bool]] = None
+) -> List[List[Tuple[int, int]]]:
+    """
+    Extend every sequence by each knight move; l_in must already be a list of sequences.
+
+    When accept is given, only the extended sequences it returns True for are kept.
+    """
+    # Sequences ending on the same coordinate share its children, so each new
+    # coordinate is mapped to one shared tuple instead of a copy per sequence
+    intern = {}.setdefault
+    if accept is not None:
+        # The output size is unknown, so rejected children are simply never appended
+        l_out = []
+        append = l_out.append
+        for t in l_in:
+            x, y = t[-1]
+            for dx, dy in _KNIGHT_MOVES:
+                coordinate = (x + dx, y + dy)
+                child = t + [intern(coordinate, coordinate)]
+                if accept(child):
+                    append(child)
+        return l_out
+
+    # Every sequence has exactly 8 children, so the output size is known up front
+    l_out = [None] * (len(_KNIGHT_MOVES) * len(l_in))
+    i = 0
     for t in l_in:
         x, y = t[-1]
-        for (m, n) in all_knight_moves(x, y):
-            l_out += [t + [(m, n)]]
+        for dx, dy in _KNIGHT_MOVES:
+            coordinate = (x + dx, y + dy)
+            l_out[i] = t + [intern(coordinate, coordinate)]
+            i += 1
     return l_out
 
+def _build_tables(
+    x_min: int,
+    x_max: int,
+    y_min: int,
+    y_max: int,
+    miss_pos: Optional[CoordinateCollection] = None,
+    vo_pos: Optional[CoordinateCollection] = None
+) -> Tuple[List[Tuple[int, int]], List[List[int]], Tuple[bool, ...]]:
+    """
+    Precompute the board as integer cells idx = (x - x_min) * width + (y - y_min).
+
+    Returns the (x, y) coordinate of every cell, the knight neighbors of every cell
+    (already excluding out-of-bounds and missing cells) and a vowel flag per cell.
+    """
+    width = y_max - y_min + 1
+    miss_set = set(miss_pos) if miss_pos is not None else set()
+    vowel_set = set(vo_pos) if vo_pos is not None else set()
+
+    cells = [(x, y) for x in range(x_min, x_max + 1) for y in range(y_min, y_max + 1)]
+    neighbors = []
+    for (x, y) in cells:
+        neighbors.append([(m - x_min) * width + (n - y_min)
+                          for (m, n) in ((x + dx, y + dy) for dx, dy in _KNIGHT_MOVES)
+                          if x_min <= m <= x_max and y_min <= n <= y_max and (m, n) not in miss_set])
+    is_vowel = tuple(cell in vowel_set for cell in cells)
+    return cells, neighbors, is_vowel
+
+def _check_n_steps(n_steps: int) -> None:
+    # Every search entry point rejects a negative step count the same way
+    if n_steps < 0:
+        raise ValueError(f"'n_steps' must be a non-negative integer, got {n_steps}")
+
+def _check_hit_count_args(location_list: Optional[CoordinateCollection], max_hit: Optional[int]) -> bool:
+    # Determine if hit count filtering should be applied (both location_list and max_hit must be provided)
+    check_sequence_hit_count_cond = (location_list is not None) and (max_hit is not None)
+    if check_sequence_hit_count_cond:
+        coordinates = list(location_list) if isinstance(location_list, (set, frozenset)) else location_list
+        assert ((location_list is not None) and is_list_of_coordinate_tuples(coordinates)), f"'location_list' must be a list of coordinate tuples"
+        assert ((max_hit is not None) and (max_hit > 0) and isinstance(max_hit, int)), f"'max_hit' must be positive integer"
+    return check_sequence_hit_count_cond
+
+@lru_cache(maxsize=32)
+def _cached_board_tables(
+    bounds: Tuple[int, int, int, int],
+    avoid_set: AbstractSet[Tuple[int, int]],
+    location_set: AbstractSet[Tuple[int, int]]
+) -> Tuple[Tuple[Tuple[int, int], ...], MoveTable, MoveTable, Tuple[bool, ...]]:
+    """
+    Board tables for one set of constraints, built once and shared by every
+    starting position searched under the same bounds, avoided and hit locations.
+    """
+    cells, neighbors, is_vowel = _build_tables(*bounds, avoid_set, location_set)
+    # Pair each neighbor with its vowel flag so the inner loop does a single
+    # tuple unpack instead of two table lookups per child
+    moves = tuple(tuple((n, is_vowel[n]) for n in cell_neighbors) for cell_neighbors in neighbors)
+    # The DFS pushes children in reverse so they are popped in knight-move order
+    reversed_moves = tuple(cell_moves[::-1] for cell_moves in moves)
+    return tuple(cells), moves, reversed_moves, is_vowel
+
+def _prepare_board(
+    x: int,
+    y: int,
+    bounds: Tuple[int, int, int, int],
+    avoid_list: Optional[CoordinateCollection],
+    location_list: Optional[CoordinateCollection],
+    max_hit: Optional[int],
+    filter: Optional[Callable[[List[Tuple[int, int]]], bool]]
+) -> Optional[Board]:
+    """
+    Validate the start cell and fetch the board tables for a search from (x, y).
+
+    Returns (start, start_hits, cells, moves, reversed_moves, hit_limit), or None
+    when the starting cell itself is rejected.
+    """
+    x_min, x_max, y_min, y_max = bounds
+    avoid_set = frozenset(avoid_list) if avoid_list is not None else frozenset()
+    if not (x_min <= x <= x_max and y_min <= y <= y_max):
+        return None
+    if (x, y) in avoid_set:
+        return None
+    if filter is not None and not filter([(x, y)]):
+        return None
+
+    location_set = frozenset(location_list) if location_list is not None else frozenset()
+    cells, moves, reversed_moves, is_vowel = _cached_board_tables((x_min, x_max, y_min, y_max), avoid_set, location_set)
+    # Without a hit limit no cell is flagged, so the limit below is never reached
+    hit_limit = max_hit if location_list is not None else 0
+
+    start = (x - x_min) * (y_max - y_min + 1) + (y - y_min)
+    return start, is_vowel[start], cells, moves, reversed_moves, hit_limit
+
 def get_all_sequences(
     x: int, 
     y: int, 
     n_steps: int, 
-    location_list: Optional[List[Tuple[int, int]]] = None, 
+    location_list: Optional[CoordinateCollection] = None, 
     max_hit: Optional[int] = None, 
-    filter: Optional[Callable[[List[Tuple[int, int]]], bool]] = None
+    filter: Optional[Callable[[List[Tuple[int, int]]], bool]] = None,
+    bounds: Optional[Tuple[int, int, int, int]] = None,
+    avoid_list: Optional[CoordinateCollection] = None
 ) -> List[List[Tuple[int, int]]]:
-    # Determine if hit count filtering should be applied (both location_list and max_hit must be provided)
-    check_sequence_hit_count_cond = (location_list is not None) and (max_hit is not None)
-    if check_sequence_hit_count_cond:
-        assert ((location_list is not None) and is_list_of_coordinate_tuples(location_list)), f"'location_list' must be a list of coordinate tuples"
-        assert ((max_hit is not None) and (max_hit > 0) and isinstance(max_hit, int)), f"'max_hit' must be positive integer"
+    return list(iter_all_sequences(x, y, n_steps, location_list, max_hit, filter, bounds, avoid_list))
 
-    sequences = [(x, y)]
+def iter_all_sequences(
+    x: int,
+    y: int,
+    n_steps: int,
+    location_list: Optional[CoordinateCollection] = None,
+    max_hit: Optional[int] = None,
+    filter: Optional[Callable[[List[Tuple[int, int]]], bool]] = None,
+    bounds: Optional[Tuple[int, int, int, int]] = None,
+    avoid_list: Optional[CoordinateCollection] = None
+) -> Iterator[List[Tuple[int, int]]]:
+    """
+    Yield the sequences of get_all_sequences(...) one at a time, in the same order.
 
-    if filter is None:
-        def filter_cond(sequence: List[Tuple[int, int]]) -> bool:
-            return True        
+    Only the current search path is held in memory, so streaming consumers do not
+    pay for the full result list.
+    """
+    _check_n_steps(n_steps)
+    check_sequence_hit_count_cond = _check_hit_count_args(location_list, max_hit)
+    if not check_sequence_hit_count_cond:
+        location_list = None
+
+    if bounds is not None:
+        board = _prepare_board(x, y, bounds, avoid_list, location_list, max_hit, filter)
+        if board is None:
+            return
+        path_bufs = _iter_board(board, n_steps, filter)
     else:
-        filter_cond = filter
-
-    if filter_cond(sequences):
-        for _ in range(n_steps):
-            if check_sequence_hit_count_cond:
-                sequences = [seq for seq in add_step(sequences) 
-                        if filter_cond(seq) and 
-                        count_sequence_hit_location_list(seq, location_list) <= max_hit]
-            else:
-                sequences = [seq for seq in add_step(sequences) if filter_cond(seq)]
-        return sequences
+        path_bufs = _iter_generic(x, y, n_steps, location_list, max_hit, filter, avoid_list)
+    for path_buf in path_bufs:
+        yield path_buf[:]
+
+def count_all_sequences(
+    x: int,
+    y: int,
+    n_steps: int,
+    location_list: Optional[CoordinateCollection] = None,
+    max_hit: Optional[int] = None,
+    filter: Optional[Callable[[List[Tuple[int, int]]], bool]] = None,
+    bounds: Optional[Tuple[int, int, int, int]] = None,
+    avoid_list: Optional[CoordinateCollection] = None
+) -> int:
+    """
+    Return len(get_all_sequences(...)) without materializing the sequences.
+
+    Without a custom filter a sequence's future only depends on its last coordinate
+    and hit count, so the count comes from a frontier of those states (on the board
+    tables when bounds are given). A custom filter may look at the whole sequence,
+    so then the same search as get_all_sequences runs and its sequences are counted
+    as they are produced.
+    """
+    _check_n_steps(n_steps)
+    check_sequence_hit_count_cond = _check_hit_count_args(location_list, max_hit)
+    if not check_sequence_hit_count_cond:
+        location_list = None
+
+    if bounds is not None:
+        board = _prepare_board(x, y, bounds, avoid_list, location_list, max_hit, filter)
+        if board is None:
+            return 0
+        if filter is None:
+            start, start_hits, _, moves, _, hit_limit = board
+            return sum(_frontier_on_board(start, n_steps, start_hits, moves, hit_limit).values())
+        return sum(1 for _ in _iter_board(board, n_steps, filter))
+    if filter is None:
+        return sum(_frontier_generic(x, y, n_steps, location_list, max_hit, avoid_list).values())
+    return sum(1 for _ in _iter_generic(x, y, n_steps, location_list, max_hit, filter, avoid_list))
+
+def count_sequences_by_endpoint(
+    x: int,
+    y: int,
+    n_steps: int,
+    location_list: Optional[CoordinateCollection] = None,
+    max_hit: Optional[int] = None,
+    filter: Optional[Callable[[List[Tuple[int, int]]], bool]] = None,
+    bounds: Optional[Tuple[int, int, int, int]] = None,
+    avoid_list: Optional[CoordinateCollection] = None
+) -> Dict[Tuple[int, int], int]:
+    """
+    Map every final coordinate of get_all_sequences(...) to the number of sequences
+    ending there, without materializing the sequences.
+
+    Uses the same (coordinate, hits) frontier as count_all_sequences, folded by
+    coordinate, so the values sum to count_all_sequences(...). With a custom filter
+    the sequences are enumerated and their endpoints tallied instead.
+    """
+    _check_n_steps(n_steps)
+    check_sequence_hit_count_cond = _check_hit_count_args(location_list, max_hit)
+    if not check_sequence_hit_count_cond:
+        location_list = None
+
+    counts = {}
+    get = counts.get
+    if bounds is not None:
+        board = _prepare_board(x, y, bounds, avoid_list, location_list, max_hit, filter)
+        if board is None:
+            return counts
+        if filter is None:
+            start, start_hits, cells, moves, _, hit_limit = board
+            for (idx, _), multiplicity in _frontier_on_board(start, n_steps, start_hits, moves, hit_limit).items():
+                end = cells[idx]
+                counts[end] = get(end, 0) + multiplicity
+            return counts
+        path_bufs = _iter_board(board, n_steps, filter)
+    elif filter is None:
+        for (end, _), multiplicity in _frontier_generic(x, y, n_steps, location_list, max_hit, avoid_list).items():
+            counts[end] = get(end, 0) + multiplicity
+        return counts
     else:
-        return []
+        path_bufs = _iter_generic(x, y, n_steps, location_list, max_hit, filter, avoid_list)
+    for path_buf in path_bufs:
+        end = path_buf[-1]
+        counts[end] = get(end, 0) + 1
+    return counts
+
+def _frontier_generic(x: int, y: int, n_steps: int,
+                      location_list: Optional[CoordinateCollection],
+                      max_hit: Optional[int],
+                      avoid_list: Optional[CoordinateCollection] = None) -> Dict[Tuple[Tuple[int, int], int], int]:
+    # Same state frontier as _frontier_on_board, keyed by coordinates on the unbounded
+    # plane; avoided coordinates are never entered
+    location_set = frozenset(location_list) if location_list is not None else frozenset()
+    avoid_set = frozenset(avoid_list) if avoid_list is not None else frozenset()
+    hit_limit = max_hit if location_list is not None else 0
+    if (x, y) in avoid_set:
+        return {}
+
+    frontier = {((x, y), int((x, y) in location_set)): 1}
+    for _ in range(n_steps):
+        next_frontier = {}
+        get = next_frontier.get
+        for ((x_f, y_f), hits), multiplicity in frontier.items():
+            for dx, dy in _KNIGHT_MOVES:
+                coordinate = (x_f + dx, y_f + dy)
+                if coordinate in avoid_set:
+                    continue
+                child_hits = hits + (coordinate in location_set)
+                if child_hits <= hit_limit:
+                    state = (coordinate, child_hits)
+                    next_frontier[state] = get(state, 0) + multiplicity
+        frontier = next_frontier
+    return frontier
+
+def _frontier_on_board(start: int, n_steps: int, start_hits: int,
+                       moves: MoveTable, hit_limit: int) -> Dict[Tuple[int, int], int]:
+    # The number of valid continuations only depends on (cell, hits so far), so the
+    # search advances a frontier of those states one step at a time, each carrying
+    # the number of partial sequences that reach it. Returns the final frontier
+    frontier = {(start, start_hits): 1}
+    for _ in range(n_steps):
+        next_frontier = {}
+        get = next_frontier.get
+        for (idx, vowel_hits), multiplicity in frontier.items():
+            for n, vowel in moves[idx]:
+                hits = vowel_hits + vowel
+                if hits <= hit_limit:
+                    state = (n, hits)
+                    next_frontier[state] = get(state, 0) + multiplicity
+        frontier = next_frontier
+    return frontier
+
+def _iter_generic(
+    x: int,
+    y: int,
+    n_steps: int,
+    location_list: Optional[CoordinateCollection],
+    max_hit: Optional[int],
+    filter: Optional[Callable[[List[Tuple[int, int]]], bool]],
+    avoid_list: Optional[CoordinateCollection] = None
+) -> Iterator[List[Tuple[int, int]]]:
+    """
+    Depth-first search on the unbounded plane, yielding the path buffer for
+    every full-length sequence (the buffer is reused, so copy it to keep it).
+    Coordinates in avoid_list are never entered.
+    """
+    avoid_set = frozenset(avoid_list) if avoid_list is not None else frozenset()
+    if (x, y) in avoid_set:
+        return
+    if filter is not None and not filter([(x, y)]):
+        return
+
+    location_set = frozenset(location_list) if location_list is not None else frozenset()
+    hit_limit = max_hit if location_list is not None else 0
+
+    # Same fixed-size path buffer as _iter_board: a node popped at depth d
+    # overwrites path_buf[d], so no child sequence is built until it is accepted.
+    # A child over the hit limit is never pushed, and a child rejected by the
+    # filter when popped prunes its whole subtree. Children are pushed in
+    # reverse so they are popped in knight-move order
+    path_buf = [(x, y)] * (n_steps + 1)
+    # Only a few coordinates are reachable in n_steps, but they are repeated in
+    # many sequences: map each to one shared tuple so the sequences kept by the
+    # caller do not each hold a fresh copy
+    intern = {}.setdefault
+    # A custom filter has to see every leaf, so only take the shortcut without one
+    last_depth = n_steps - 1 if filter is None else -1
+    stack = [((x, y), 0, (x, y) in location_set)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        coordinate, depth, hits = pop()
+        path_buf[depth] = coordinate
+        if filter is not None and depth and not filter(path_buf[:depth + 1]):
+            continue
+        if depth == n_steps:
+            yield path_buf
+            continue
+        x_f, y_f = coordinate
+        if depth == last_depth:
+            # Last step without a filter: the children are final, so write them
+            # in place (in knight-move order) and yield instead of pushing them
+            for dx, dy in _KNIGHT_MOVES:
+                coordinate = (x_f + dx, y_f + dy)
+                if coordinate not in avoid_set and hits + (coordinate in location_set) <= hit_limit:
+                    path_buf[n_steps] = intern(coordinate, coordinate)
+                    yield path_buf
+            continue
+        for dx, dy in _REVERSED_KNIGHT_MOVES:
+            coordinate = (x_f + dx, y_f + dy)
+            if coordinate in avoid_set:
+                continue
+            child_hits = hits + (coordinate in location_set)
+            if child_hits <= hit_limit:
+                push((intern(coordinate, coordinate), depth + 1, child_hits))
+
+def _iter_board(
+    board: Board,
+    n_steps: int,
+    filter: Optional[Callable[[List[Tuple[int, int]]], bool]]
+) -> Iterator[List[Tuple[int, int]]]:
+    """
+    Depth-first search over integer board cells, yielding the path buffer for
+    every full-length sequence (the buffer is reused, so copy it to keep it).
+    """
+    start, start_hits, cells, moves, reversed_moves, hit_limit = board
+
+    # Iterative DFS over a fixed-size buffer of coordinates: a node popped at depth d
+    # overwrites path_buf[d], and path_buf[:d] always holds its ancestors. Cells are
+    # only decoded into this buffer, so accepted sequences are copied out as-is and
+    # the custom filter gets a plain slice
+    path_buf = [cells[start]] * (n_steps + 1)
+    # A custom filter has to see every leaf, so only take the shortcut without one
+    last_depth = n_steps - 1 if filter is None else -1
+    stack = [(start, 0, start_hits)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        idx, depth, vowel_hits = pop()
+        path_buf[depth] = cells[idx]
+        if filter is not None and depth and not filter(path_buf[:depth + 1]):
+            continue
+        if depth == n_steps:
+            yield path_buf
+            continue
+        if depth == last_depth:
+            # Last step without a filter: every child within the hit limit is a
+            # full sequence, so write it in place and yield instead of pushing it
+            for n, vowel in moves[idx]:
+                if vowel_hits + vowel <= hit_limit:
+                    path_buf[n_steps] = cells[n]
+                    yield path_buf
+            continue
+        # Children are pushed in reverse so they are popped in knight-move order
+        for n, vowel in reversed_moves[idx]:
+            hits = vowel_hits + vowel
+            if hits <= hit_limit:
+                push((n, depth + 1, hits))
+
+
+if __name__ == "__main__":
+    from src.keypad_data import get_keypad_data
+    from src.positions import classify_coordinates, get_coordinate_bounds
+    from src.sequence_check import check_in_avoided_coordinate, check_inside_bounds, count_sequence_hit_location_list
+
+    # Keypad constraints, as used by main.py
+    coordinate_data = get_keypad_data()
+    positions = classify_coordinates(coordinate_data)
+    miss_pos, vo_pos = positions['missing'], positions['vowels']
+    bounds_dict = get_coordinate_bounds(coordinate_data)
+    bounds = (bounds_dict['x_min'], bounds_dict['x_max'], bounds_dict['y_min'], bounds_dict['y_max'])
+    max_hit = 2
+
+    def inside_and_not_avoided(sequence):
+        return check_inside_bounds(sequence, *bounds) and not check_in_avoided_coordinate(sequence, miss_pos)
+
+    def accept(sequence):
+        return inside_and_not_avoided(sequence) and count_sequence_hit_location_list(sequence, vo_pos) <= max_hit
+
+    print("Checking that all search variants agree on the keypad:")
+    print(f"Bounds: {bounds}, avoided: {sorted(miss_pos)}, vowels: {sorted(vo_pos)}, max_hit: {max_hit}")
+    print()
+
+    for n_steps in range(5):
+        total = 0
+        for x in range(bounds[0], bounds[1] + 1):
+            for y in range(bounds[2], bounds[3] + 1):
+                # Reference: extend step by step and keep the sequences every constraint accepts
+                reference = [[(x, y)]] if accept([(x, y)]) else []
+                for _ in range(n_steps):
+                    if reference:
+                        reference = add_step(reference, accept)
+
+                constraints = dict(location_list=vo_pos, max_hit=max_hit)
+                on_board = get_all_sequences(x, y, n_steps, bounds=bounds, avoid_list=miss_pos, **constraints)
+                by_filter = get_all_sequences(x, y, n_steps, filter=inside_and_not_avoided, **constraints)
+                avoid_only = get_all_sequences(x, y, n_steps, avoid_list=miss_pos,
+                                               filter=lambda s: check_inside_bounds(s, *bounds), **constraints)
+                assert on_board == reference, (x, y, n_steps, "bounds")
+                assert by_filter == reference, (x, y, n_steps, "filter")
+                assert avoid_only == reference, (x, y, n_steps, "avoid_list without bounds")
+                assert list(iter_all_sequences(x, y, n_steps, bounds=bounds, avoid_list=miss_pos, **constraints)) == reference
+
+                for kwargs in (dict(bounds=bounds, avoid_list=miss_pos), dict(filter=inside_and_not_avoided)):
+                    assert count_all_sequences(x, y, n_steps, **kwargs, **constraints) == len(reference), (x, y, n_steps, kwargs)
+                    endpoints = count_sequences_by_endpoint(x, y, n_steps, **kwargs, **constraints)
+                    assert sum(endpoints.values()) == len(reference), (x, y, n_steps, kwargs)
+                    assert all(endpoints[sequence[-1]] > 0 for sequence in reference)
+                total += len(reference)
+        print(f"  {n_steps} steps: {total} sequences from every start, all variants agree")
@@ -1,3 +1,9 @@
+try:
+    from src._vowel_lut import VOWELS, VOWEL_SET, DELETE_VOWELS
+except ModuleNotFoundError:
+    # Run directly as a script (python src/<module>.py), so src/ itself is on the path
+    from _vowel_lut import VOWELS, VOWEL_SET, DELETE_VOWELS
+
 def has_at_most_two_vowels(text: str) -> bool:
     """
     Check if a string contains at most two vowels.
@@ -49,14 +55,16 @@ def has_at_most_two_vowels(text: str) -> bool:
     ---------
     count_vowels : Get the exact number of vowels in a string
     """
-    # Define vowels (both lowercase and uppercase for efficiency)
-    vowels = "aeiouAEIOU"
-    
-    # Count vowels in the text
-    vowel_count = sum(1 for char in text if char in vowels)
-    
-    # Return True if 2 or less vowels found
-    return vowel_count <= 2
+    # Count vowels in the text, stopping as soon as a third one is found
+    vowel_count = 0
+    for char in text:
+        if char in VOWEL_SET:
+            vowel_count += 1
+            if vowel_count > 2:
+                return False
+    
+    # 2 or less vowels found
+    return True
 
 
 def count_vowels(text: str) -> int:
@@ -104,13 +112,18 @@ def count_vowels(text: str) -> int:
     - Duplicate vowels are counted separately (e.g., "book" returns 2)
     - Only English vowels (a, e, i, o, u) are considered
     - Non-alphabetic characters are ignored
+    - Other iterables of characters (e.g. a list) are counted item by item
     
     See Also:
     ---------
     has_at_most_two_vowels : Check if string has 2 or fewer vowels
     """
-    vowels = "aeiouAEIOU"
-    return sum(1 for char in text if char in vowels)
+    if type(text) is not str:
+        # Only str has translate, so anything else is counted the plain way
+        return sum(1 for char in text if char in VOWELS)
+    
+    # Deleting the vowels in one C-level pass leaves the length difference as the count
+    return len(text) - len(text.translate(DELETE_VOWELS))
 
 if __name__ == "__main__":
 
@@ -1,3 +1,28 @@
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+try:
+    from src._vowel_lut import DELETE_VOWELS, LOWER_VOWELS, MASK_SORTED_VOWELS, MASK_VOWELS, VOWEL_BITS, VOWEL_BYTES, VOWEL_MASK_SIZES, VOWEL_SET
+    from src.vowel_check import count_vowels
+except ModuleNotFoundError:
+    # Run directly as a script (python src/<module>.py), so src/ itself is on the path
+    from _vowel_lut import DELETE_VOWELS, LOWER_VOWELS, MASK_SORTED_VOWELS, MASK_VOWELS, VOWEL_BITS, VOWEL_BYTES, VOWEL_MASK_SIZES, VOWEL_SET
+    from vowel_check import count_vowels
+
+# Strings up to this length are counted in a single pass, longer ones chunk by chunk
+_SCAN_CHUNK_SIZE = 1024
+
+# Joins the strings of a batch; it contains no vowel, so translate keeps it
+_BATCH_SEPARATOR = "\x00"
+
+# Strings up to this length (words, short phrases) have their vowel count and
+# vowel mask memoized, so repeated words cost a dict lookup. Each of the two caches
+# keeps its most recent _TEXT_CACHE_SIZE strings alive; with keys this short that
+# is at most about 12 MiB per cache for ASCII text (roughly twice that for text
+# outside Latin-1). Longer text is never cached, and neither are lists and other
+# iterables of characters, which are scanned item by item
+_CACHED_TEXT_LENGTH = 64
+_TEXT_CACHE_SIZE = 65536
+
 def has_exactly_two_vowels(text: str) -> bool:
     """
     Check if a string contains exactly two vowels.
@@ -47,15 +72,77 @@ def has_exactly_two_vowels(text: str) -> bool:
     - Duplicate vowels are counted separately (e.g., "book" has 2 vowels)
     - Only English vowels (a, e, i, o, u) are considered
     """
-    # Define vowels (both lowercase and uppercase for efficiency)
-    vowels = "aeiouAEIOU"
-    
-    # Count vowels in the text
-    vowel_count = sum(1 for char in text if char in vowels)
+    if type(text) is not str:
+        # Other iterables of characters have no translate, see count_vowels
+        return count_vowels(text) == 2
+    
+    # Count vowels in the text in a single pass, memoized for short strings
+    if len(text) <= _SCAN_CHUNK_SIZE:
+        if len(text) <= _CACHED_TEXT_LENGTH:
+            return _cached_vowel_count(text) == 2
+        return _count_vowels_in_one_pass(text) == 2
+    
+    # Long text: count in doubling chunks so a third vowel ends the scan early,
+    # while text with few vowels still costs about one full translate pass
+    vowel_count = 0
+    start = 0
+    size = _SCAN_CHUNK_SIZE
+    while start < len(text):
+        chunk = text[start:start + size]
+        vowel_count += len(chunk) - len(chunk.translate(DELETE_VOWELS))
+        if vowel_count > 2:
+            return False
+        start += size
+        size *= 2
     
     # Return True if exactly 2 vowels found
     return vowel_count == 2
 
+def has_exactly_two_vowels_batch(texts: Iterable[str]) -> List[bool]:
+    """
+    Check many strings at once for containing exactly two vowels.
+    
+    Equivalent to [has_exactly_two_vowels(text) for text in texts], but the
+    vowels of all strings are deleted in a single str.translate pass over the
+    joined text, instead of one call (and one Python frame) per string.
+    
+    Parameters:
+    -----------
+    texts : Iterable[str]
+        The input strings to check for vowels
+    
+    Returns:
+    --------
+    List[bool]
+        One result per input string, in input order
+    
+    Examples:
+    ---------
+    >>> has_exactly_two_vowels_batch(["hello", "world", "book", ""])
+    [True, False, True, False]
+    
+    Notes:
+    ------
+    - Same rules as has_exactly_two_vowels (case-insensitive, English vowels)
+    - Best suited to many short strings; the whole batch is held in memory
+    - Strings containing the NUL separator are handled by falling back to
+      per-string checks
+    
+    See Also:
+    ---------
+    has_exactly_two_vowels : Check a single string
+    """
+    texts = list(texts)
+    
+    # Delete the vowels of every string in one pass, then split them apart again
+    stripped = _BATCH_SEPARATOR.join(texts).translate(DELETE_VOWELS).split(_BATCH_SEPARATOR)
+    if len(stripped) != len(texts):
+        # A string contained the separator itself, so the split is not aligned
+        return [has_exactly_two_vowels(text) for text in texts]
+    
+    # The vowel count of each string is the length it lost
+    return [len(text) - len(rest) == 2 for text, rest in zip(texts, stripped)]
+
 def has_exactly_two_different_vowels(text: str) -> bool:
     """
     Check if a string contains exactly two different (unique) vowels.
@@ -110,16 +197,13 @@ def has_exactly_two_different_vowels(text: str) -> bool:
     - Only English vowels (a, e, i, o, u) are considered
     - Useful for linguistic analysis where vowel diversity matters more than frequency
     """
-    # Define vowels for checking
-    vowels = "aeiouAEIOU"
-    
-    # Find unique vowels in the text (case-insensitive)
-    unique_vowels = set(char.lower() for char in text if char in vowels)
+    # Collect the distinct vowels, stopping as soon as a third one shows up
+    vowel_mask = _vowel_mask(text, 3)
     
     # Return True if exactly 2 different vowels found
-    return len(unique_vowels) == 2
+    return VOWEL_MASK_SIZES[vowel_mask] == 2
 
-def get_unique_vowels(text: str) -> set[str]:
+def get_unique_vowels(text: str) -> frozenset[str]:
     """
     Get the set of unique vowels in a string.
     
@@ -134,34 +218,36 @@ def get_unique_vowels(text: str) -> set[str]:
     
     Returns:
     --------
-    set[str]
-        Set of unique vowels found in the string (all lowercase).
-        Returns empty set if no vowels are found.
+    frozenset[str]
+        Frozen set of unique vowels found in the string (all lowercase).
+        Returns an empty frozenset if no vowels are found.
     
     Examples:
     ---------
     >>> get_unique_vowels("hello")
-    {'e', 'o'}
+    frozenset({'e', 'o'})
     
     >>> get_unique_vowels("beautiful")
-    {'a', 'e', 'i', 'u'}
+    frozenset({'a', 'e', 'i', 'u'})
     
     >>> get_unique_vowels("EDUCATION")
-    {'a', 'e', 'i', 'o', 'u'}  # All vowels, case-insensitive
+    frozenset({'a', 'e', 'i', 'o', 'u'})  # All vowels, case-insensitive
     
     >>> get_unique_vowels("bcdfg")
-    set()  # No vowels
+    frozenset()  # No vowels
     
     >>> get_unique_vowels("aaaeeee")
-    {'a', 'e'}  # Duplicates removed
+    frozenset({'a', 'e'})  # Duplicates removed
     
     >>> get_unique_vowels("")
-    set()  # Empty string
+    frozenset()  # Empty string
     
     Notes:
     ------
     - Case-insensitive: returns all vowels in lowercase
     - Duplicates are automatically removed (set behavior)
+    - The result is immutable and shared between calls (one of 32 precomputed
+      frozensets); use set(get_unique_vowels(text)) if a mutable copy is needed
     - Only English vowels (a, e, i, o, u) are considered
     - Non-alphabetic characters are ignored
     - Useful for vowel diversity analysis
@@ -171,8 +257,43 @@ def get_unique_vowels(text: str) -> set[str]:
     has_exactly_two_different_vowels : Check for exactly 2 unique vowels
     has_at_least_two_different_vowels : Check for 2+ unique vowels
     """
-    vowels = "aeiouAEIOU"
-    return set(char.lower() for char in text if char in vowels)
+    return MASK_VOWELS[_vowel_mask(text)]
+
+def get_sorted_unique_vowels(text: str) -> Tuple[str, ...]:
+    """
+    Get the unique vowels in a string in alphabetical order.
+    
+    Same vowels as get_unique_vowels, but returned as a tuple in a, e, i, o, u
+    order. The tuple is looked up from the vowel mask, so no sort is needed when
+    the vowels are displayed.
+    
+    Parameters:
+    -----------
+    text : str
+        The input string to analyze for unique vowels. Can be any string including empty string.
+    
+    Returns:
+    --------
+    Tuple[str, ...]
+        Unique vowels found in the string (all lowercase), in alphabetical order.
+        Returns an empty tuple if no vowels are found.
+    
+    Examples:
+    ---------
+    >>> get_sorted_unique_vowels("education")
+    ('a', 'e', 'i', 'o', 'u')
+    
+    >>> get_sorted_unique_vowels("Hello")
+    ('e', 'o')
+    
+    >>> get_sorted_unique_vowels("rhythm")
+    ()  # No vowels
+    
+    See Also:
+    ---------
+    get_unique_vowels : The same vowels as a frozenset
+    """
+    return MASK_SORTED_VOWELS[_vowel_mask(text)]
 
 def has_at_least_two_different_vowels(text: str) -> bool:
     """
@@ -232,14 +353,64 @@ def has_at_least_two_different_vowels(text: str) -> bool:
     - Useful for linguistic analysis focusing on vowel diversity
     - Returns True for words with 2, 3, 4, or 5 different vowels
     """
-    # Define vowels for checking
-    vowels = "aeiouAEIOU"
-    
-    # Find unique vowels in the text (case-insensitive)
-    unique_vowels = set(char.lower() for char in text if char in vowels)
+    # Collect the distinct vowels, stopping as soon as a second one shows up
+    vowel_mask = _vowel_mask(text, 2)
     
     # Return True if at least 2 different vowels found
-    return len(unique_vowels) >= 2
+    return VOWEL_MASK_SIZES[vowel_mask] >= 2
+
+def _vowel_mask(text: str, stop_at: int = len(LOWER_VOWELS)) -> int:
+    # Distinct vowels in text (case-insensitive) as a bit mask, see VOWEL_BITS. The
+    # scan ends early once stop_at different vowels have been found, since the
+    # predicates above only need to know whether a count is exceeded
+    if type(text) is not str:
+        # Other iterables of characters (possibly without a len) are scanned item by item
+        return _scan_vowel_mask(text, stop_at)
+    if len(text) <= _SCAN_CHUNK_SIZE:
+        # Short strings are cached with their full mask, whatever stop_at is
+        if len(text) <= _CACHED_TEXT_LENGTH:
+            return _cached_vowel_mask(text)
+        return _scan_vowel_mask(text, stop_at)
+    
+    # Long text: intersect doubling chunks with the vowel set, so the characters
+    # are scanned in C while a chunk still ends the scan early
+    vowel_mask = 0
+    start = 0
+    size = _SCAN_CHUNK_SIZE
+    while start < len(text):
+        for char in VOWEL_SET.intersection(text[start:start + size]):
+            vowel_mask |= VOWEL_BITS[char]
+        if VOWEL_MASK_SIZES[vowel_mask] >= stop_at:
+            break
+        start += size
+        size *= 2
+    return vowel_mask
+
+def _scan_vowel_mask(text: Iterable[str], stop_at: int = len(LOWER_VOWELS)) -> int:
+    # Character-by-character vowel mask of a short string or other iterable, see _vowel_mask
+    vowel_mask = 0
+    get_bit = VOWEL_BITS.get
+    for char in text:
+        bit = get_bit(char)
+        if bit:
+            vowel_mask |= bit
+            if VOWEL_MASK_SIZES[vowel_mask] >= stop_at:
+                break
+    return vowel_mask
+
+def _count_vowels_in_one_pass(text: str) -> int:
+    # Count vowels in a str (callers handle other iterables): deleting them in one
+    # C-level pass leaves the length difference as the count
+    if text.isascii():
+        # ASCII text: bytes.translate deletes through a flat 256-entry table,
+        # which beats the mapping lookups of str.translate even with the encode
+        data = text.encode("ascii")
+        return len(data) - len(data.translate(None, VOWEL_BYTES))
+    return len(text) - len(text.translate(DELETE_VOWELS))
+
+# Memoized versions for strings of at most _CACHED_TEXT_LENGTH characters
+_cached_vowel_count = lru_cache(maxsize=_TEXT_CACHE_SIZE)(_count_vowels_in_one_pass)
+_cached_vowel_mask = lru_cache(maxsize=_TEXT_CACHE_SIZE)(_scan_vowel_mask)
 
 
 
@@ -266,7 +437,7 @@ if __name__ == "__main__":
 
     for test_word in test_cases:
         result = has_exactly_two_vowels(test_word)
-        vowel_count = sum(1 for char in test_word if char.lower() in "aeiou")
+        vowel_count = count_vowels(test_word)
         print(f"'{test_word}': {vowel_count} vowels -> has_exactly_two_vowels = {result}")
 
     print()
@@ -298,11 +469,10 @@ if __name__ == "__main__":
     ]
 
     for test_word in test_cases:
-        unique_vowels = get_unique_vowels(test_word)
+        vowel_list = list(get_sorted_unique_vowels(test_word))
         result = has_exactly_two_different_vowels(test_word)
-        vowel_list = sorted(list(unique_vowels))
         
-        print(f"'{test_word}': {vowel_list} ({len(unique_vowels)} different) -> {result}")
+        print(f"'{test_word}': {vowel_list} ({len(vowel_list)} different) -> {result}")
 
     print()
     two_different_vowel_words = [word for word in test_cases if has_exactly_two_different_vowels(word)]
@@ -314,7 +484,7 @@ if __name__ == "__main__":
     print("Word".ljust(12), "Total".ljust(6), "Different".ljust(10), "=2 Total".ljust(9), "=2 Different")
     print("-" * 55)
     for word in ["hello", "book", "queue", "beautiful", "area"]:
-        total_vowels = sum(1 for char in word if char.lower() in "aeiou")
+        total_vowels = count_vowels(word)
         different_vowels = len(get_unique_vowels(word))
         has_2_total = has_exactly_two_vowels(word)
         has_2_different = has_exactly_two_different_vowels(word)
@@ -349,11 +519,10 @@ if __name__ == "__main__":
     ]
 
     for test_word in test_cases:
-        unique_vowels = get_unique_vowels(test_word)
+        vowel_list = list(get_sorted_unique_vowels(test_word))
         result = has_at_least_two_different_vowels(test_word)
-        vowel_list = sorted(list(unique_vowels))
         
-        print(f"'{test_word}': {vowel_list} ({len(unique_vowels)} different) -> {result}")
+        print(f"'{test_word}': {vowel_list} ({len(vowel_list)} different) -> {result}")
 
     print()
     at_least_two_different_vowel_words = [word for word in test_cases if has_at_least_two_different_vowels(word)]
@@ -368,7 +537,7 @@ if __name__ == "__main__":
     for word in comparison_words:
         unique_vowels = get_unique_vowels(word)
         unique_count = len(unique_vowels)
-        total_vowels = sum(1 for char in word if char.lower() in "aeiou")
+        total_vowels = count_vowels(word)
         
         has_at_least_2_diff = has_at_least_two_different_vowels(word)
         has_exactly_2_diff = has_exactly_two_different_vowels(word)